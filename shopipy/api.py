@@ -1,31 +1,90 @@
-from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import unquote
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from shopipy.config import ACCESS_TOKEN, API_VERSION, SHOP_URL
+from shopipy.config import ACCESS_TOKEN, API_VERSION, SHOP_URL, ensure_env
+
+try:
+  # Optional speedup: orjson parses large order payloads several times
+  # faster than the stdlib; fall back silently when it isn't installed
+  from orjson import loads as _json_loads
+except ImportError:
+  from json import loads as _json_loads
 
 console = Console()
 
+# Matches the page_info query parameter of the rel="next" link in
+# Shopify's Link header, e.g. <https://...?page_info=abc>; rel="next"
+_NEXT_PAGE_RE = re.compile(
+  r'<[^>]*[?&]page_info=([^&>]+)[^>]*>;\s*rel="next"'
+)
+
 
 class ShopifyAPI:
   """
   A class to interact with the Shopify API.
   """
 
-  def __init__(self) -> None:
+  def __init__(self, use_bulk: bool = False) -> None:
     """
     Initialize the ShopifyAPI with authentication details.
+
+    :param use_bulk: Fetch orders via a GraphQL bulk operation instead
+      of REST pagination (falls back to REST on error).
     """
+    ensure_env()
+    self.use_bulk: bool = use_bulk
     self.access_token: str = ACCESS_TOKEN
     self.shop_url: str = SHOP_URL
     self.api_version: str = API_VERSION
     self.headers: Dict[str, str] = {
       "X-Shopify-Access-Token": self.access_token
     }
+    # Reuse a single pooled session so the paginated loop keeps its
+    # TCP+TLS connection alive instead of handshaking on every request.
+    self.session: requests.Session = requests.Session()
+    self.session.headers.update(self.headers)
+    # Retry rate-limited and transient server errors with exponential
+    # backoff, honoring Shopify's Retry-After header on 429 responses
+    retries = Retry(
+      total=8,
+      backoff_factor=0.5,
+      status_forcelist=(429, 500, 502, 503, 504),
+      respect_retry_after_header=True,
+      allowed_methods=frozenset(["GET"]),
+    )
+    self.session.mount(
+      "https://",
+      HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries),
+    )
+    # Fetched results are cached per instance so chained subcommands
+    # don't re-issue the whole paginated fetch; see invalidate()
+    self._orders_cache: Optional[List[Dict[str, Any]]] = None
+    self._items_cache: Optional[List[Dict[str, Any]]] = None
+
+  def invalidate(self) -> None:
+    """
+    Clear cached orders so the next call refetches from Shopify.
+    """
+    self._orders_cache = None
+    self._items_cache = None
+
+  def close(self) -> None:
+    """
+    Close the underlying HTTP session and its pooled connections.
+    """
+    self.session.close()
 
   def get_order_count(self) -> int:
     """
@@ -40,7 +99,7 @@ class ShopifyAPI:
     }
 
     try:
-      response = requests.get(url, headers=self.headers, params=params)
+      response = self.session.get(url, params=params, timeout=(5, 30))
       response.raise_for_status()
     except RequestException as e:
       console.print_exception(f"[bold red]API Call Failed:[/bold red] {e}")
@@ -49,17 +108,16 @@ class ShopifyAPI:
     count = response.json().get("count", 0)
     return count
 
-  def fetch_open_orders(self) -> List[Dict[str, Any]]:
+  def iter_open_orders(self) -> Iterator[Dict[str, Any]]:
     """
-    Fetch all open (unfulfilled) orders from Shopify using pagination.
+    Yield open (unfulfilled) orders from Shopify page by page.
 
-    :return: List of order dictionaries.
-    """
-    total_orders = self.get_order_count()
-    if total_orders == 0:
-      console.print(":x: No open orders found")
-      return []
+    Each page is parsed and handed to the consumer before the next one
+    is retained, so only one page of JSON is resident at a time rather
+    than the whole order book.
 
+    :return: Iterator of order dictionaries.
+    """
     url: str = f"{self.shop_url}/api/{self.api_version}/orders.json"
     params: Dict[str, Any] = {
       "status": "open",
@@ -67,41 +125,189 @@ class ShopifyAPI:
       "limit": 250,
     }
 
-    orders: List[Dict[str, Any]] = []
-    fetched_orders = 0
-
-    while True:
-      try:
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-      except RequestException as e:
-        console.print_exception(f"[bold red]API Call Failed:[/bold red] {e}")
-        break
-
-      current_orders = response.json().get("orders", [])
-      orders.extend(current_orders)
-      fetched_orders += len(current_orders)
-
-      # Check if all orders have been fetched
-      if fetched_orders >= total_orders:
-        break
-
-      # Check for 'Link' header for pagination
-      link_header = response.headers.get("Link", "")
-      if 'rel="next"' not in link_header:
-        # No more pages to fetch
-        break
-
-      # Extract 'page_info' for the next page
-      next_page_info = self.extract_next_page_info(link_header)
-      if not next_page_info:
-        break
-
-      # Update params for the next request
-      params = {
-        "page_info": next_page_info,
-        "limit": 250,
+    found_any = False
+
+    # Prefetch the next page while the current one is being parsed so
+    # pagination latency is hidden behind the JSON processing.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      future = executor.submit(
+        self.session.get, url, params=params, timeout=(5, 30)
+      )
+      while True:
+        try:
+          response = future.result()
+          response.raise_for_status()
+        except RequestException as e:
+          console.print_exception(
+            f"[bold red]API Call Failed:[/bold red] {e}"
+          )
+          break
+
+        # Extract 'page_info' and kick off the next request before
+        # parsing the current page's body. The absence of a
+        # 'rel="next"' link is Shopify's end-of-stream signal.
+        future = None
+        link_header = response.headers.get("Link", "")
+        if 'rel="next"' in link_header:
+          next_page_info = self.extract_next_page_info(link_header)
+          if next_page_info:
+            future = executor.submit(
+              self.session.get,
+              url,
+              params={"page_info": next_page_info, "limit": 250},
+              timeout=(5, 30),
+            )
+
+        current_orders = _json_loads(response.content).get("orders", [])
+        found_any = found_any or bool(current_orders)
+        yield from current_orders
+
+        if future is None:
+          # No more pages to fetch
+          break
+
+    if not found_any:
+      console.print(":x: No open orders found")
+
+  def fetch_open_orders(self) -> List[Dict[str, Any]]:
+    """
+    Fetch all open (unfulfilled) orders from Shopify using pagination.
+
+    :return: List of order dictionaries.
+    """
+    if self._orders_cache is None:
+      if self.use_bulk:
+        self._orders_cache = self.fetch_open_orders_bulk()
+      else:
+        self._orders_cache = list(self.iter_open_orders())
+    return self._orders_cache
+
+  def fetch_open_orders_bulk(self) -> List[Dict[str, Any]]:
+    """
+    Fetch all open (unfulfilled) orders via a GraphQL bulk operation.
+
+    A bulk operation streams the whole result set as one JSONL download
+    instead of one REST request per 250 orders, sidestepping the
+    rate-limit bucket for large stores. Falls back to the paginated
+    REST fetch on any error.
+
+    :return: List of order dictionaries shaped like the REST payload.
+    """
+    url: str = f"{self.shop_url}/api/{self.api_version}/graphql.json"
+    mutation: str = """
+    mutation {
+      bulkOperationRunQuery(
+        query: \"\"\"
+        {
+          orders(query: "status:open fulfillment_status:unfulfilled") {
+            edges {
+              node {
+                id
+                lineItems {
+                  edges {
+                    node { sku variantTitle quantity }
+                  }
+                }
+              }
+            }
+          }
+        }
+        \"\"\"
+      ) {
+        bulkOperation { id }
+        userErrors { field message }
       }
+    }
+    """
+
+    try:
+      response = self.session.post(
+        url, json={"query": mutation}, timeout=(5, 30)
+      )
+      response.raise_for_status()
+      user_errors = response.json()["data"]["bulkOperationRunQuery"][
+        "userErrors"
+      ]
+      if user_errors:
+        raise RuntimeError(f"Bulk query rejected: {user_errors}")
+      download_url = self._poll_bulk_operation(url)
+    except Exception as e:
+      console.print(
+        f":x: Bulk order fetch failed, falling back to REST: {e}"
+      )
+      return list(self.iter_open_orders())
+
+    if download_url is None:
+      # Operation completed with an empty result set
+      console.print(":x: No open orders found")
+      return []
+
+    return self._parse_bulk_jsonl(download_url)
+
+  def _poll_bulk_operation(
+    self, url: str, attempts: int = 60, interval: float = 1.0
+  ) -> Optional[str]:
+    """
+    Poll the current bulk operation until it completes.
+
+    :param url: The GraphQL endpoint URL.
+    :param attempts: Maximum number of status polls.
+    :param interval: Seconds to wait between polls.
+    :return: The JSONL download URL, or None for an empty result.
+    """
+    status_query = "{ currentBulkOperation { status errorCode url } }"
+
+    for _ in range(attempts):
+      time.sleep(interval)
+      response = self.session.post(
+        url, json={"query": status_query}, timeout=(5, 30)
+      )
+      response.raise_for_status()
+      operation = response.json()["data"]["currentBulkOperation"]
+      status = operation.get("status")
+      if status == "COMPLETED":
+        return operation.get("url")
+      if status in ("FAILED", "CANCELED", "EXPIRED"):
+        raise RuntimeError(
+          f"Bulk operation {status}: {operation.get('errorCode')}"
+        )
+
+    raise RuntimeError("Bulk operation timed out")
+
+  def _parse_bulk_jsonl(self, download_url: str) -> List[Dict[str, Any]]:
+    """
+    Stream and reassemble the bulk operation's JSONL result.
+
+    Child nodes carry a __parentId pointing at their order, so line
+    items are folded back into REST-style "line_items" lists.
+
+    :param download_url: URL of the JSONL file to download.
+    :return: List of order dictionaries shaped like the REST payload.
+    """
+    orders: List[Dict[str, Any]] = []
+    orders_by_id: Dict[str, Dict[str, Any]] = {}
+
+    with self.session.get(
+      download_url, stream=True, timeout=(5, 30)
+    ) as response:
+      response.raise_for_status()
+      for line in response.iter_lines():
+        if not line:
+          continue
+        node = _json_loads(line)
+        parent_id = node.get("__parentId")
+        if parent_id is None:
+          order: Dict[str, Any] = {"id": node.get("id"), "line_items": []}
+          orders_by_id[node["id"]] = order
+          orders.append(order)
+        elif parent_id in orders_by_id:
+          orders_by_id[parent_id]["line_items"].append(
+            {
+              "sku": node.get("sku"),
+              "variant_title": node.get("variantTitle"),
+              "quantity": node.get("quantity"),
+            }
+          )
 
     return orders
 
@@ -112,61 +318,69 @@ class ShopifyAPI:
     :param link_header: The 'Link' header string from the response.
     :return: The 'page_info' parameter string or None if not found.
     """
-    links = link_header.split(",")
-    for link in links:
-      segments = link.strip().split(";")
-      if len(segments) < 2:
-        continue
-      link_part = segments[0].strip("<>")
-      rel_part = segments[1].strip()
-      if rel_part == 'rel="next"':
-        # Parse the URL to extract 'page_info'
-        parsed_url = urlparse(link_part)
-        query_params = parse_qs(parsed_url.query)
-        page_info = query_params.get("page_info", [None])[0]
-        return page_info
-    return None
-
-  def extract_order_items(self) -> List[Dict[str, Any]]:
+    match = _NEXT_PAGE_RE.search(link_header)
+    if not match:
+      return None
+    # The header value is percent-encoded; decode it so requests
+    # doesn't double-encode the cursor when re-sending it as a param
+    return unquote(match.group(1))
+
+  def iter_order_items(self) -> Iterator[Dict[str, Any]]:
     """
-    Extract SKU, variant, and quantity from open orders.
+    Yield aggregated SKU, variant, and quantity entries from open orders.
 
-    :return: List of dictionaries containing SKU, variant, and quantity.
-    """
-    orders: List[Dict[str, Any]] = self.fetch_open_orders()
-    sku_dict: Dict[str, Dict[str, Any]] = {}
+    Entries are produced one at a time so consumers like
+    create_order_table can stream them without an intermediate list.
 
-    for order in orders:
+    :return: Iterator of dictionaries containing SKU, variant, quantity.
+    """
+    # Two flat dicts (totals and first-seen variant per SKU) instead of
+    # a dict of nested dicts: one allocation-free int add per line item
+    quantities: Dict[str, int] = defaultdict(int)
+    variants: Dict[str, str] = {}
+
+    # Aggregate pages as they stream in; peak memory is one page of
+    # orders plus the per-SKU totals, not the whole order book. Reuse
+    # already-fetched orders when a previous call cached them, and go
+    # through the (cached) bulk fetch when it's enabled.
+    source: Iterable[Dict[str, Any]] = (
+      self.fetch_open_orders()
+      if self.use_bulk or self._orders_cache is not None
+      else self.iter_open_orders()
+    )
+    for order in source:
       for line_item in order.get("line_items", []):
         sku: Optional[str] = line_item.get("sku")
         variant_title: Optional[str] = line_item.get("variant_title")
         quantity: Optional[int] = line_item.get("quantity")
 
         if sku and variant_title and quantity:
-          if sku in sku_dict:
-            sku_dict[sku]["quantity"] += quantity
-          else:
-            sku_dict[sku] = {
-              "variant": variant_title,
-              "quantity": quantity,
-            }
+          quantities[sku] += quantity
+          variants.setdefault(sku, variant_title)
 
-    results: List[Dict[str, Any]] = [
-      {"sku": sku, **details} for sku, details in sku_dict.items()
-    ]
+    for sku, total in quantities.items():
+      yield {"sku": sku, "variant": variants[sku], "quantity": total}
+
+  def extract_order_items(self) -> List[Dict[str, Any]]:
+    """
+    Extract SKU, variant, and quantity from open orders.
 
-    return results
+    :return: List of dictionaries containing SKU, variant, and quantity.
+    """
+    if self._items_cache is None:
+      self._items_cache = list(self.iter_order_items())
+    return self._items_cache
 
   def create_order_table(
-    self, orders: Optional[List[Dict[str, Any]]] = None
+    self, orders: Optional[Iterable[Dict[str, Any]]] = None
   ) -> None:
     """
     Create a table of open orders using the Rich library.
 
-    :param orders: List of order dictionaries.
+    :param orders: Iterable of order dictionaries.
     """
     if orders is None:
-      orders = self.extract_order_items()
+      orders = self.iter_order_items()
 
     table = Table(
       title="[bold]Unfulfilled Orders[/bold]",
@@ -175,7 +389,19 @@ class ShopifyAPI:
     table.add_column("Variant", style="magenta")
     table.add_column("Quantity", style="green")
 
-    for order in orders:
-      table.add_row(order["sku"], order["variant"], str(order["quantity"]))
+    # Materialize rows as Text cells first and bind add_row once; Text
+    # instances skip Rich's per-cell markup parsing, and the loop is a
+    # single C-level call per order
+    rows = [
+      (
+        Text(order["sku"]),
+        Text(order["variant"]),
+        Text(str(order["quantity"])),
+      )
+      for order in orders
+    ]
+    add_row = table.add_row
+    for row in rows:
+      add_row(*row)
 
     console.print(table)
@@ -1,15 +1,64 @@
+import atexit
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 
 from shopipy.api import ShopifyAPI
-from shopipy.config import ASSET_PATH, FILES_PATH, OrderVariant
+from shopipy.config import (
+  ASSET_PATH,
+  FILES_PATH,
+  VARIANT_TITLE_MAP,
+  OrderVariant,
+  iter_resolved_orders,
+)
 
 console = Console()
 
 
+def _is_current(src_stat: os.stat_result, dst_stat: os.stat_result) -> bool:
+  """
+  Whether an existing destination still matches its source image.
+
+  A hardlinked destination shares the source inode; a copied one is
+  considered current when the sizes match and the copy is at least as
+  new as the source. A replaced source (new inode, larger/newer file)
+  fails both checks and is re-materialized.
+
+  :param src_stat: Stat result of the source file.
+  :param dst_stat: Stat result of the destination file.
+  :return: True if the destination is up to date.
+  """
+  if (
+    dst_stat.st_ino == src_stat.st_ino
+    and dst_stat.st_dev == src_stat.st_dev
+  ):
+    return True
+  return (
+    dst_stat.st_size == src_stat.st_size
+    and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+  )
+
+
+def _materialize(src: Path, dst: Path) -> None:
+  """
+  Place a copy of src at dst as cheaply as possible.
+
+  A hardlink shares the source inode (an O(1) metadata operation); fall
+  back to a byte copy when linking crosses filesystems or is denied.
+
+  :param src: Source file path.
+  :param dst: Destination file path.
+  """
+  try:
+    os.link(src, dst)
+  except OSError:
+    shutil.copyfile(src, dst)
+
+
 class AssetOrganizer:
   """
   A class to organize assets based on order variants.
@@ -35,6 +84,22 @@ class AssetOrganizer:
 
     self.ASSET_PATH: Path = ASSET_PATH
     self.FILES_PATH: Path = FILES_PATH
+    self._pool: Optional[ThreadPoolExecutor] = None
+
+  def _executor(self) -> ThreadPoolExecutor:
+    """
+    Return the shared worker pool, creating it on first use.
+
+    One pool serves every parallel stage for the lifetime of the
+    organizer, so repeated runs don't pay thread start-up again; it is
+    shut down at interpreter exit.
+    """
+    if self._pool is None:
+      self._pool = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 4) * 4)
+      )
+      atexit.register(self._pool.shutdown, wait=True)
+    return self._pool
 
   def map_variant_title(self, variant_title: str) -> Optional[str]:
     """
@@ -43,13 +108,7 @@ class AssetOrganizer:
     :param variant_title: The variant title from the order.
     :return: Mapped variant title or None if it should be skipped.
     """
-    variant_title_map: Dict[str, Optional[str]] = {
-      "Small": "5x7",
-      "Medium": "8x10",
-      "Large": "11x14",
-      "$1.98": None,  # Skip this variant
-    }
-    return variant_title_map.get(variant_title, variant_title)
+    return VARIANT_TITLE_MAP.get(variant_title, variant_title)
 
   def organize_images_by_variant(self) -> List[str]:
     """
@@ -58,56 +117,91 @@ class AssetOrganizer:
     :return: List of missing image SKUs.
     """
     missing_skus: List[str] = []
+    # One directory scan per variant replaces a stat syscall per SKU;
+    # the cached stat results also drive the staleness check below
+    available: Dict[OrderVariant, Dict[str, os.stat_result]] = {}
+    # Desired folder contents: per variant, destination name -> source
+    desired: Dict[OrderVariant, Dict[str, Tuple[Path, os.stat_result]]] = {
+      v: {} for v in OrderVariant
+    }
 
-    for variant in OrderVariant:
-      # Folder location for the variant
-      folder_path: Path = self.FILES_PATH / variant.value
-
-      # Remove existing folder and its contents if it exists
-      if folder_path.exists():
-        shutil.rmtree(folder_path)
-
-      # Create directory for the variant
-      folder_path.mkdir(parents=True, exist_ok=True)
-
-    for item in self.orders:
-      sku: str = item["sku"]
-      variant_title: str = item["variant"]
-      quantity: int = item["quantity"]
-
-      # Map variant titles to standard sizes
-      variant_title = self.map_variant_title(variant_title)
-      if variant_title is None:
-        continue  # Skip this item
-
-      # Use OrderVariant Enum for variant titles
-      try:
-        variant = OrderVariant(variant_title)
-      except ValueError:
-        # Log invalid variant title
-        continue
+    # Resolve per-variant source and destination folders once instead
+    # of re-allocating the same Path objects for every order item
+    src_dirs: Dict[OrderVariant, Path] = {
+      v: self.ASSET_PATH / v.value for v in OrderVariant
+    }
+    dest_dirs: Dict[OrderVariant, Path] = {
+      v: self.FILES_PATH / v.value for v in OrderVariant
+    }
 
+    # Title mapping and Enum resolution are shared with the PDF
+    # aggregation loop via iter_resolved_orders
+    for sku, variant, quantity in iter_resolved_orders(self.orders):
       # Source file path for the SKU image
-      source_image_file: Path = self.ASSET_PATH / variant.value / f"{sku}.jpg"
-
-      # Destination folder path
-      dest_folder: Path = self.FILES_PATH / variant.value
-
-      if source_image_file.exists():
-        for i in range(1, quantity + 1):
-          dest_filename: str = (
-            f"{sku}_{i}.jpg" if quantity > 1 else f"{sku}.jpg"
-          )
-
-          # Destination file path
-          dest_image_file: Path = dest_folder / dest_filename
-          try:
-            shutil.copy(source_image_file, dest_image_file)
-          except Exception as e:
-            console.print_exception(f"Log copy failure: {e}")
-            pass
-      else:
+      source_image_file: Path = src_dirs[variant] / f"{sku}.jpg"
+
+      # Scan the variant folder once and reuse the name -> stat map
+      names = available.get(variant)
+      if names is None:
+        try:
+          with os.scandir(src_dirs[variant]) as entries:
+            names = {
+              entry.name: entry.stat()
+              for entry in entries
+              if entry.is_file()
+            }
+        except FileNotFoundError:
+          names = {}
+        available[variant] = names
+
+      src_stat = names.get(source_image_file.name)
+      if src_stat is None:
         # Add the missing SKU to the list
         missing_skus.append(sku)
+        continue
+
+      for i in range(1, quantity + 1):
+        dest_filename: str = (
+          f"{sku}_{i}.jpg" if quantity > 1 else f"{sku}.jpg"
+        )
+        desired[variant][dest_filename] = (source_image_file, src_stat)
+
+    # Reconcile each variant folder incrementally: drop stale files,
+    # re-materialize ones whose source was replaced, and leave matching
+    # files alone so reruns over a similar order set do almost no I/O
+    copy_jobs: List[Tuple[Path, Path]] = []
+    for variant in OrderVariant:
+      folder_path: Path = dest_dirs[variant]
+      folder_path.mkdir(parents=True, exist_ok=True)
+      with os.scandir(folder_path) as entries:
+        existing = {
+          entry.name: entry.stat() for entry in entries if entry.is_file()
+        }
+
+      want = desired[variant]
+      for name in existing.keys() - want.keys():
+        (folder_path / name).unlink()
+      for name, (source_image_file, src_stat) in want.items():
+        dest_stat = existing.get(name)
+        if dest_stat is not None:
+          if _is_current(src_stat, dest_stat):
+            continue
+          # Source was replaced since this file was materialized
+          (folder_path / name).unlink()
+        copy_jobs.append((source_image_file, folder_path / name))
+
+    # Materialize independent destinations in parallel; disk latency
+    # overlaps across workers instead of serializing per file
+    if copy_jobs:
+      executor = self._executor()
+      futures = {
+        executor.submit(_materialize, src, dst): dst
+        for src, dst in copy_jobs
+      }
+      for future in as_completed(futures):
+        try:
+          future.result()
+        except Exception as e:
+          console.print_exception(f"Log copy failure: {e}")
 
     return missing_skus, self.ASSET_PATH
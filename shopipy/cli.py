@@ -1,16 +1,15 @@
+import functools
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
 import typer
-from dotenv import dotenv_values, find_dotenv, load_dotenv, set_key, unset_key
+from dotenv import dotenv_values, find_dotenv, set_key, unset_key
 from rich.console import Console
 from rich.table import Table
 from typing_extensions import Annotated
 
-from shopipy.api import ShopifyAPI
-from shopipy.assets import AssetOrganizer
 from shopipy.config import OrderVariant
-from shopipy.pdf import PDFGenerator
 
 app = typer.Typer(
   rich_markup_mode="rich", no_args_is_help=True, name="shopipy"
@@ -27,17 +26,46 @@ app.add_typer(config_cmd, name="config", help="Configure application settings")
 
 console = Console()
 
-# Instantiate API
-shopify_api = ShopifyAPI()
+# Set by the app callback before any subcommand constructs the API
+_use_bulk = False
 
-# Load environment variables
-dotenv_path = find_dotenv()
-if not dotenv_path:
-  dotenv_path = Path(".env")
+
+@functools.lru_cache(maxsize=None)
+def _api() -> Any:
+  """
+  Create the ShopifyAPI on first use and reuse it afterwards.
+
+  Deferred so `--help` and config commands don't pay for the API
+  module import or environment validation.
+  """
+  from shopipy.api import ShopifyAPI
+
+  return ShopifyAPI(use_bulk=_use_bulk)
+
+# The environment itself is loaded by shopipy.config (before its
+# constants are computed); this path only backs the config commands.
+dotenv_path = Path(
+  os.environ.get("SHOPIPY_DOTENV") or find_dotenv() or ".env"
+)
+if not dotenv_path.exists():
   dotenv_path.touch()  # Create an empty .env file
-else:
-  dotenv_path = Path(dotenv_path)
-load_dotenv(dotenv_path)
+
+
+@app.callback()
+def main(
+  bulk: Annotated[
+    bool,
+    typer.Option(
+      "--bulk",
+      help="Fetch orders via a GraphQL bulk operation (falls back to REST)",
+    ),
+  ] = False,
+) -> None:
+  """
+  Manage Shopify orders for print-on-demand products.
+  """
+  global _use_bulk
+  _use_bulk = bulk
 
 
 @files_cmd.command(name="pdf", help="Generate a PDF from open orders")
@@ -45,8 +73,10 @@ def generate_pdf() -> None:
   """
   Generate a PDF from open orders.
   """
+  from shopipy.pdf import PDFGenerator
+
   # Create an instance of PDFGenerator
-  pdfr = PDFGenerator(api=shopify_api)
+  pdfr = PDFGenerator(api=_api())
   with console.status("Generating PDF...", spinner="aesthetic"):
     try:
       assets_info: Dict[str, List[Path]] = pdfr.aggregate_image_files()
@@ -65,8 +95,9 @@ def generate_pdf() -> None:
         console.print(
           f":mag_right: [bold]Missing items in folder: {pdfr.ASSET_PATH}[/bold]"
         )
-        for sku in items_missing:
-          console.print(sku, style="yellow")
+        console.print(
+          "\n".join(str(sku) for sku in items_missing), style="yellow"
+        )
 
     except Exception as e:
       console.print(f":x: Failed to generate PDF: {e}")
@@ -77,6 +108,7 @@ def list_orders() -> None:
   """
   List all open orders from Shopify.
   """
+  shopify_api = _api()
   with console.status(
     "[bold]Retrieving Shopify Orders[/bold]", spinner="aesthetic"
   ):
@@ -118,6 +150,8 @@ def add_order_item(
     console.print(":x: Quantity must be a positive integer.")
     raise typer.Exit(code=1)
 
+  from shopipy.pdf import PDFGenerator
+
   # Create an instance of PDFGenerator
   pdf_generator = PDFGenerator(orders=[], api=None)
 
@@ -159,8 +193,10 @@ def create_folders(
   """
   Create directories for storing assets.
   """
+  from shopipy.assets import AssetOrganizer
+
   # Create an instance of AssetOrganizer
-  asset_organizer = AssetOrganizer(api=shopify_api)
+  asset_organizer = AssetOrganizer(api=_api())
   try:
     missing_skus, asset_path = asset_organizer.organize_images_by_variant()
     console.print(
@@ -172,8 +208,9 @@ def create_folders(
       console.print(
         f":mag_right: [bold]Missing items in folder: {asset_path}[/bold]"
       )
-      for sku in missing_skus:
-        console.print(sku, style="yellow")
+      console.print(
+        "\n".join(str(sku) for sku in missing_skus), style="yellow"
+      )
   except Exception as e:
     console.print(f":x: Failed to create directories: {e}")
 
@@ -2,11 +2,18 @@ import os
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 from dotenv import load_dotenv
 
-# Load environment variables from a .env file if present
-load_dotenv()
+# Load environment variables before any constants below snapshot them.
+# SHOPIPY_DOTENV points at an explicit file and skips python-dotenv's
+# parent-directory walk; already-exported values always win.
+_dotenv_override = os.environ.get("SHOPIPY_DOTENV")
+if _dotenv_override:
+  load_dotenv(_dotenv_override, override=False)
+else:
+  load_dotenv()
 
 # Application information
 APP_NAME = "shopipy"
@@ -24,21 +31,30 @@ ASSET_PATH = Path(os.getenv("ASSET_PATH", HOME_DIR / "assets"))
 FILES_PATH = Path(os.getenv("FILES_PATH", HOME_DIR / "files"))
 PDF_DIR = Path(os.getenv("PDF_DIR", HOME_DIR / "Documents" / "prints"))
 
-# Ensure essential environment variables are set
-REQUIRED_ENV_VARS = {
-  "ADMIN_API_KEY": ACCESS_TOKEN,
-  "STORE_NAME": SHOP_NAME,
-}
+# Environment variables required for Shopify API access
+REQUIRED_ENV_VARS = ("ADMIN_API_KEY", "STORE_NAME")
+
+
+def ensure_env() -> None:
+  """Raise if the environment variables required for API access are unset.
+
+  Called from the code paths that actually talk to Shopify, so offline
+  commands like --help and config show work without credentials.
+  """
+  missing_vars = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+  if missing_vars:
+    raise EnvironmentError(
+      f"Missing required environment variables: {', '.join(missing_vars)}"
+    )
 
-missing_vars = [var for var, value in REQUIRED_ENV_VARS.items() if not value]
-if missing_vars:
-  raise EnvironmentError(
-    f"Missing required environment variables: {', '.join(missing_vars)}"
-  )
+def make_pdf_path() -> Path:
+  """Build a timestamped PDF output path under PDF_DIR.
 
-# Construct PDF_PATH with timestamp
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-PDF_PATH = PDF_DIR / f"ph_{timestamp}.pdf"
+  Computed at call time so each generated PDF gets a fresh timestamp
+  instead of one frozen at module import.
+  """
+  timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+  return PDF_DIR / f"ph_{timestamp}.pdf"
 
 # Construct the Shopify shop URL
 SHOP_URL = f"https://{SHOP_NAME}.myshopify.com/admin"
@@ -53,3 +69,48 @@ class OrderVariant(Enum):
   XXLARGE = "18x24"
   XXXLARGE = "24x36"
   XXXXLARGE = "30x40"
+
+
+# Map variant titles from the order data to standard sizes; None means
+# the variant should be skipped. Built once at import time so the hot
+# per-item loops pay a single dict lookup.
+VARIANT_TITLE_MAP = {
+  "Small": "5x7",
+  "Medium": "8x10",
+  "Large": "11x14",
+  "$1.98": None,  # Skip this variant
+}
+
+# Value -> member lookup so hot loops avoid Enum construction and its
+# ValueError path for bad titles
+_VARIANT_BY_VALUE: Dict[str, OrderVariant] = {
+  v.value: v for v in OrderVariant
+}
+
+
+def iter_resolved_orders(
+  orders: Iterable[Dict[str, Any]],
+  on_invalid: Optional[Callable[[str], None]] = None,
+) -> Iterator[Tuple[str, OrderVariant, int]]:
+  """Yield (sku, variant, quantity) for order items with a valid variant.
+
+  Title mapping and OrderVariant resolution happen once here so the
+  organize and aggregate loops don't each repeat them per item.
+
+  :param orders: Iterable of order dictionaries.
+  :param on_invalid: Optional callback invoked with unknown titles.
+  :return: Iterator of (sku, variant, quantity) tuples.
+  """
+  for item in orders:
+    variant_title = item["variant"]
+    variant_title = VARIANT_TITLE_MAP.get(variant_title, variant_title)
+    if variant_title is None:
+      continue  # Mapped to "skip this variant"
+
+    variant = _VARIANT_BY_VALUE.get(variant_title)
+    if variant is None:
+      if on_invalid is not None:
+        on_invalid(variant_title)
+      continue
+
+    yield item["sku"], variant, item["quantity"]
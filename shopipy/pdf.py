@@ -1,4 +1,6 @@
 import io
+import itertools
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -6,12 +8,35 @@ import img2pdf
 import PyPDF2
 from rich.console import Console
 
+try:
+  # Optional speedup: pikepdf's QPDF backend clones page trees without
+  # rebuilding the document in Python; fall back to PyPDF2 without it
+  import pikepdf
+except ImportError:
+  pikepdf = None
+
 from shopipy.api import ShopifyAPI
-from shopipy.config import ASSET_PATH, PDF_DIR, PDF_PATH, OrderVariant
+from shopipy.config import (
+  ASSET_PATH,
+  PDF_DIR,
+  VARIANT_TITLE_MAP,
+  OrderVariant,
+  iter_resolved_orders,
+  make_pdf_path,
+)
 
 console = Console()
 
 
+def _print_invalid_variant(variant_title: str) -> None:
+  """
+  Report an order item whose variant title has no OrderVariant.
+
+  :param variant_title: The unresolvable variant title.
+  """
+  console.print(f":x: Invalid variant title: {variant_title}")
+
+
 class PDFGenerator:
   """
   A class to generate and manipulate PDFs from images.
@@ -37,7 +62,7 @@ class PDFGenerator:
 
     self.ASSET_PATH: Path = ASSET_PATH
     self.PDF_DIR: Path = PDF_DIR
-    self.PDF_PATH: Path = PDF_PATH
+    self.PDF_PATH: Path = make_pdf_path()
 
   def map_variant_title(self, variant_title: str) -> Optional[str]:
     """
@@ -46,13 +71,7 @@ class PDFGenerator:
     :param variant_title: The variant title from the order.
     :return: Mapped variant title or None if it should be skipped.
     """
-    variant_title_map: Dict[str, Optional[str]] = {
-      "Small": "5x7",
-      "Medium": "8x10",
-      "Large": "11x14",
-      "$1.98": None,  # Skip this variant
-    }
-    return variant_title_map.get(variant_title, variant_title)
+    return VARIANT_TITLE_MAP.get(variant_title, variant_title)
 
   def aggregate_image_files(self) -> Dict[str, List[Path]]:
     """
@@ -62,28 +81,31 @@ class PDFGenerator:
     """
     image_files: List[Path] = []
     missing_sku: List[Path] = []
-
-    for item in self.orders:
-      sku: str = item["sku"]
-      variant_title: str = item["variant"]
-      quantity: int = item["quantity"]
-
-      # Map variant titles
-      variant_title = self.map_variant_title(variant_title)
-      if variant_title is None:
-        continue  # Skip this item
-
-      # Use OrderVariant Enum for variant titles
-      try:
-        variant = OrderVariant(variant_title)
-      except ValueError:
-        console.print(f":x: Invalid variant title: {variant_title}")
-        continue
+    # One directory scan per variant replaces a stat syscall per SKU;
+    # the folder Path is built once per variant alongside it
+    available: Dict[OrderVariant, set] = {}
+    variant_dirs: Dict[OrderVariant, Path] = {}
+
+    # Title mapping and Enum resolution are shared with the organize
+    # loop via iter_resolved_orders
+    for sku, variant, quantity in iter_resolved_orders(
+      self.orders, on_invalid=_print_invalid_variant
+    ):
+      # Scan the variant folder once and reuse the name set
+      names = available.get(variant)
+      if names is None:
+        variant_dirs[variant] = self.ASSET_PATH / variant.value
+        try:
+          with os.scandir(variant_dirs[variant]) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+          names = set()
+        available[variant] = names
 
       # File path for the SKU image
-      image_file: Path = self.ASSET_PATH / variant.value / f"{sku}.jpg"
-      if image_file.exists():
-        image_files.extend([image_file] * quantity)
+      image_file: Path = variant_dirs[variant] / f"{sku}.jpg"
+      if image_file.name in names:
+        image_files.extend(itertools.repeat(image_file, quantity))
       else:
         missing_sku.append(sku)
 
@@ -106,13 +128,19 @@ class PDFGenerator:
       )
       return
 
-    image_files_str: List[str] = [
-      str(image_file) for image_file in image_files
-    ]
-
     try:
+      # Read each unique image once; repeated pages (quantity > 1)
+      # reuse the same bytes instead of re-reading the file per page
+      contents: Dict[Path, bytes] = {
+        image_file: image_file.read_bytes()
+        for image_file in dict.fromkeys(image_files)
+      }
+      pages: List[bytes] = [contents[p] for p in image_files]
+
+      # Stream pages straight into the file handle so the full PDF is
+      # never buffered in memory
       with open(self.PDF_PATH, "wb") as f:
-        f.write(img2pdf.convert(image_files_str))
+        img2pdf.convert(pages, outputstream=f)
     except Exception as e:
       console.print_exception(f":x: Failed to create PDF: {e}")
       raise
@@ -123,15 +151,26 @@ class PDFGenerator:
 
     :return: Path to the most recent PDF file or None if none found.
     """
-    pdf_files: List[Path] = [
-      f for f in self.PDF_DIR.iterdir() if f.is_file() and f.suffix == ".pdf"
-    ]
+    # scandir entries carry cached stat info, so this is a single
+    # O(N) pass instead of a sort with a stat per comparison
+    try:
+      with os.scandir(self.PDF_DIR) as entries:
+        most_recent = max(
+          (
+            entry
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".pdf")
+          ),
+          key=lambda entry: entry.stat().st_mtime_ns,
+          default=None,
+        )
+    except FileNotFoundError:
+      return None
 
-    if not pdf_files:
+    if most_recent is None:
       return None
 
-    pdf_files.sort(key=lambda x: x.stat().st_mtime)
-    most_recent_pdf: Path = pdf_files[-1]
+    most_recent_pdf: Path = self.PDF_DIR / most_recent.name
     console.print(f":paperclip: Most recent PDF: {most_recent_pdf.name}")
     return most_recent_pdf
 
@@ -153,23 +192,21 @@ class PDFGenerator:
       return
 
     try:
-      # Read the existing PDF
-      with open(pdf_path, "rb") as pdf_file:
-        reader = PyPDF2.PdfReader(pdf_file)
+      image_pdf_bytes = img2pdf.convert(str(image_path))
+      new_pdf_path: Path = pdf_path.with_name(f"{pdf_path.stem}_updated.pdf")
+
+      if pikepdf is not None:
+        with pikepdf.open(pdf_path) as base:
+          with pikepdf.open(io.BytesIO(image_pdf_bytes)) as addon:
+            base.pages.extend(addon.pages)
+            base.save(new_pdf_path)
+      else:
         writer = PyPDF2.PdfWriter()
 
-        # Copy pages from reader to writer
-        for page in reader.pages:
-          writer.add_page(page)
-
-        # Convert image to PDF and add to writer
-        image_pdf_bytes = img2pdf.convert(str(image_path))
-        image_pdf_reader = PyPDF2.PdfReader(io.BytesIO(image_pdf_bytes))
-        for page in image_pdf_reader.pages:
-          writer.add_page(page)
-
-        # Write the updated PDF
-        new_pdf_path: Path = pdf_path.with_name(f"{pdf_path.stem}_updated.pdf")
+        # Bulk-clone the existing document, then the converted image;
+        # append() copies page trees without a Python loop per page
+        writer.append(str(pdf_path))
+        writer.append(io.BytesIO(image_pdf_bytes))
         with open(new_pdf_path, "wb") as new_pdf_file:
           writer.write(new_pdf_file)
       console.print(